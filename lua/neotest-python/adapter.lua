@@ -6,6 +6,7 @@ local base = require("neotest-python.base")
 ---@class neotest-python._AdapterConfig
 ---@field dap_args? table
 ---@field pytest_discovery? boolean
+---@field pytest_fixture_profile_file? string
 ---@field is_test_file fun(file_path: string):boolean
 ---@field get_python_command fun(root: string):string[]
 ---@field get_args fun(runner: string, position: neotest.Position, strategy: string): string[]
@@ -33,6 +34,11 @@ return function(config)
       table.insert(script_args, "--emit-parameterized-ids")
     end
 
+    if config.pytest_fixture_profile_file then
+      table.insert(script_args, "--fixture-profile-file")
+      table.insert(script_args, config.pytest_fixture_profile_file)
+    end
+
     local position = run_args.tree:data()
 
     table.insert(script_args, "--")
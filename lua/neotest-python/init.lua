@@ -4,6 +4,7 @@ local create_adapter = require("neotest-python.adapter")
 ---@class neotest-python.AdapterConfig
 ---@field dap? table
 ---@field pytest_discover_instances? boolean
+---@field pytest_fixture_profile_file? string
 ---@field is_test_file? fun(file_path: string):boolean
 ---@field python? string|string[]|fun(root: string):string[]
 ---@field args? string[]|fun(runner: string, position: neotest.Position, strategy: string): string[]
@@ -59,6 +60,7 @@ local augment_config = function(config)
   ---@type neotest-python._AdapterConfig
   return {
     pytest_discovery = config.pytest_discover_instances,
+    pytest_fixture_profile_file = config.pytest_fixture_profile_file,
     dap_args = config.dap,
     get_runner = get_runner,
     get_args = get_args,
@@ -1,7 +1,7 @@
 import argparse
 import json
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 from neotest_python.base import NeotestAdapter, NeotestResult
 
@@ -12,11 +12,15 @@ class TestRunner(str, Enum):
     DJANGO = "django"
 
 
-def get_adapter(runner: TestRunner, emit_parameterized_ids: bool) -> NeotestAdapter:
+def get_adapter(
+    runner: TestRunner,
+    emit_parameterized_ids: bool,
+    fixture_profile_file: Optional[str] = None,
+) -> NeotestAdapter:
     if runner == TestRunner.PYTEST:
         from .pytest import PytestNeotestAdapter
 
-        return PytestNeotestAdapter(emit_parameterized_ids)
+        return PytestNeotestAdapter(emit_parameterized_ids, fixture_profile_file)
     elif runner == TestRunner.UNITTEST:
         from .unittest import UnittestNeotestAdapter
 
@@ -47,6 +51,11 @@ parser.add_argument(
     action="store_true",
     help="Emit parameterized test ids (pytest only)",
 )
+parser.add_argument(
+    "--fixture-profile-file",
+    dest="fixture_profile_file",
+    help="File to write aggregated fixture timings JSON to (pytest only)",
+)
 parser.add_argument("args", nargs="*")
 
 
@@ -64,7 +73,9 @@ def main(argv: List[str]) -> int:
         return extract_test_name_template(argv)
 
     args = parser.parse_args(argv)
-    adapter = get_adapter(TestRunner(args.runner), args.emit_parameterized_ids)
+    adapter = get_adapter(
+        TestRunner(args.runner), args.emit_parameterized_ids, args.fixture_profile_file
+    )
 
     with open(args.stream_file, "w") as stream_file:
 
@@ -20,13 +20,23 @@ if TYPE_CHECKING:
         message: str
         line: Optional[int]
 
-    class NeotestResult(TypedDict):
+    class NeotestFixtureTiming(TypedDict):
+        name: str
+        scope: str
+        phase: str
+        duration: float
+
+    class _NeotestResult(TypedDict):
         short: Optional[str]
         status: NeotestResultStatus
         errors: Optional[List[NeotestError]]
 
+    class NeotestResult(_NeotestResult, total=False):
+        fixtures: List[NeotestFixtureTiming]
+
 else:
     NeotestError = Dict
+    NeotestFixtureTiming = Dict
     NeotestResult = Dict
 
 
@@ -36,11 +46,15 @@ class NeotestAdapter(abc.ABC):
     ) -> NeotestResult:
         if not base:
             return update
-        return {
+        result: NeotestResult = {
             "status": max(base["status"], update["status"]),
             "errors": (base.get("errors") or []) + (update.get("errors") or []) or None,
             "short": (base.get("short") or "") + (update.get("short") or ""),
         }
+        fixtures = (base.get("fixtures") or []) + (update.get("fixtures") or [])
+        if fixtures:
+            result["fixtures"] = fixtures
+        return result
 
     @abc.abstractmethod
     def run(self, args: List[str], stream: Callable) -> Tuple[Dict, int]:
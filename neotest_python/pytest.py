@@ -1,5 +1,7 @@
 import json
+import math
 import re
+import time
 from io import StringIO
 from pathlib import Path
 from typing import Callable, Dict, Generator, List, Optional, Tuple, Union
@@ -9,30 +11,41 @@ from _pytest._code.code import ExceptionRepr
 from _pytest.fixtures import FixtureLookupErrorRepr
 from _pytest.terminal import TerminalReporter
 
-from .base import NeotestAdapter, NeotestError, NeotestResult, NeotestResultStatus
+from .base import (
+    NeotestAdapter,
+    NeotestError,
+    NeotestFixtureTiming,
+    NeotestResult,
+    NeotestResultStatus,
+)
 
 ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
 class PytestNeotestAdapter(NeotestAdapter):
-    def __init__(self, emit_parameterized_ids: bool):
+    def __init__(
+        self, emit_parameterized_ids: bool, fixture_profile_file: Optional[str] = None
+    ):
         self.emit_parameterized_ids = emit_parameterized_ids
+        self.fixture_profile_file = fixture_profile_file
 
     def run(
         self,
         args: List[str],
         stream: Callable[[str, NeotestResult], None],
     ) -> Tuple[Dict[str, NeotestResult], int]:
+        fixture_profiler = None
+        plugins: List[object] = [NeotestDebugpyPlugin()]
+        if self.fixture_profile_file:
+            fixture_profiler = NeotestFixtureProfiler(self.fixture_profile_file)
+            plugins.append(fixture_profiler)
         result_collector = NeotestResultCollector(
-            self, stream=stream, emit_parameterized_ids=self.emit_parameterized_ids
-        )
-        exit_code = pytest.main(
-            args=args,
-            plugins=[
-                result_collector,
-                NeotestDebugpyPlugin(),
-            ],
+            self,
+            stream=stream,
+            emit_parameterized_ids=self.emit_parameterized_ids,
+            fixture_profiler=fixture_profiler,
         )
+        exit_code = pytest.main(args=args, plugins=[result_collector, *plugins])
         return result_collector.results, int(exit_code)
 
 
@@ -42,10 +55,12 @@ class NeotestResultCollector:
         adapter: PytestNeotestAdapter,
         stream: Callable[[str, NeotestResult], None],
         emit_parameterized_ids: bool,
+        fixture_profiler: Optional["NeotestFixtureProfiler"] = None,
     ):
         self.stream = stream
         self.adapter = adapter
         self.emit_parameterized_ids = emit_parameterized_ids
+        self.fixture_profiler = fixture_profiler
 
         self.pytest_config: Optional["pytest.Config"] = None  # type: ignore
         self.results: Dict[str, NeotestResult] = {}
@@ -129,23 +144,16 @@ class NeotestResultCollector:
             None,
         )
 
-    def pytest_runtest_logreport(self, report: "pytest.TestReport") -> None:
-        if not (
-            report.when == "call"
-            or (report.when == "setup" and report.outcome in ("skipped", "failed"))
-        ):
-            return
-
-        file_path, *name_path = report.nodeid.split("::")
+    def _get_pos_id(self, nodeid: str) -> Tuple[str, str, bool]:
+        """Returns the position ID, error message prefix and whether the test
+        is a parameterized instance."""
+        file_path, *name_path = nodeid.split("::")
         abs_path = self._get_abs_path(file_path)
         *namespaces, test_name = name_path
         valid_test_name, *params = test_name.split("[")  # ]
 
         pos_id = "::".join([abs_path, *namespaces, valid_test_name])
 
-        errors: List[NeotestError] = []
-        short = self._get_short_output(self.pytest_config, report)
-
         msg_prefix = ""
         param_id = None
         if "[" in test_name and test_name.endswith("]"):
@@ -156,6 +164,48 @@ class NeotestResultCollector:
             else:
                 msg_prefix = f"[{param_id}] "
 
+        return pos_id, msg_prefix, bool(params)
+
+    def _attach_fixture_timings(self, report: "pytest.TestReport") -> None:
+        if not self.fixture_profiler:
+            return
+        timings = self.fixture_profiler.pop_timings(report.nodeid)
+        pos_id, _, params = self._get_pos_id(report.nodeid)
+        base = self.results.get(pos_id)
+        if not timings or not base:
+            return
+
+        result: NeotestResult = self.adapter.update_result(
+            base,
+            {
+                "short": None,
+                "status": base["status"],
+                "errors": None,
+                "fixtures": timings,
+            },
+        )
+        if not params:
+            self.stream(pos_id, result)
+        self.results[pos_id] = result
+
+    def pytest_runtest_logreport(self, report: "pytest.TestReport") -> None:
+        if report.when == "teardown":
+            # All fixtures used by the test, including finalizers of wider
+            # scoped fixtures torn down after it, have been timed by now.
+            self._attach_fixture_timings(report)
+            return
+
+        if not (
+            report.when == "call"
+            or (report.when == "setup" and report.outcome in ("skipped", "failed"))
+        ):
+            return
+
+        pos_id, msg_prefix, params = self._get_pos_id(report.nodeid)
+
+        errors: List[NeotestError] = []
+        short = self._get_short_output(self.pytest_config, report)
+
         if report.outcome == "failed":
             exc_repr = report.longrepr
             # Test fails due to condition outside of test e.g. xfail
@@ -197,6 +247,104 @@ class NeotestResultCollector:
         self.results[pos_id] = result
 
 
+class NeotestFixtureProfiler:
+    """A pytest plugin that times the setup and teardown of every fixture.
+
+    Timings are attributed to the test that was running when the fixture was
+    set up or torn down, and an aggregated per-fixture report is written to
+    `report_path` at the end of the session.
+    """
+
+    def __init__(self, report_path: str):
+        self.report_path = report_path
+        self.current_nodeid: Optional[str] = None
+        self.instances: List[Dict] = []
+        self.timings: Dict[str, List[NeotestFixtureTiming]] = {}
+        self._teardown_starts: Dict["pytest.FixtureDef", Tuple[Dict, float]] = {}
+
+    def pop_timings(self, nodeid: str) -> List[NeotestFixtureTiming]:
+        return self.timings.pop(nodeid, [])
+
+    def _record(self, instance: Dict, phase: str, duration: float) -> None:
+        instance[phase] = duration
+        if self.current_nodeid is None:
+            return
+        self.timings.setdefault(self.current_nodeid, []).append(
+            {
+                "name": instance["name"],
+                "scope": instance["scope"],
+                "phase": phase,
+                "duration": duration,
+            }
+        )
+
+    def pytest_runtest_logstart(self, nodeid: str, location) -> None:
+        self.current_nodeid = nodeid
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(
+        self, fixturedef: "pytest.FixtureDef", request: "pytest.FixtureRequest"
+    ) -> Generator:
+        start = time.perf_counter()
+        yield
+        duration = time.perf_counter() - start
+
+        instance = {
+            "name": fixturedef.argname,
+            "scope": fixturedef.scope,
+            "setup": 0.0,
+            "teardown": 0.0,
+        }
+        self.instances.append(instance)
+        self._record(instance, "setup", duration)
+
+        # Finalizers run in reverse order of registration, so this runs just
+        # before the fixture's own teardown and pytest_fixture_post_finalizer
+        # is called once all of them are done.
+        def mark_teardown_start():
+            self._teardown_starts[fixturedef] = (instance, time.perf_counter())
+
+        fixturedef.addfinalizer(mark_teardown_start)
+
+    def pytest_fixture_post_finalizer(
+        self, fixturedef: "pytest.FixtureDef", request: "pytest.FixtureRequest"
+    ) -> None:
+        # Older pytest versions can call this hook more than once per teardown
+        started = self._teardown_starts.pop(fixturedef, None)
+        if started is None:
+            return
+        instance, start = started
+        self._record(instance, "teardown", time.perf_counter() - start)
+
+    def build_report(self) -> List[Dict]:
+        durations: Dict[Tuple[str, str], List[float]] = {}
+        for instance in self.instances:
+            key = (instance["name"], instance["scope"])
+            durations.setdefault(key, []).append(
+                instance["setup"] + instance["teardown"]
+            )
+
+        report = []
+        for (name, scope), costs in durations.items():
+            costs.sort()
+            # Nearest-rank percentile
+            p95 = costs[max(0, math.ceil(0.95 * len(costs)) - 1)]
+            report.append(
+                {
+                    "name": name,
+                    "scope": scope,
+                    "count": len(costs),
+                    "total": sum(costs),
+                    "p95": p95,
+                }
+            )
+        return sorted(report, key=lambda entry: entry["total"], reverse=True)
+
+    def pytest_sessionfinish(self, session: "pytest.Session") -> None:
+        with open(self.report_path, "w") as report_file:
+            json.dump(self.build_report(), report_file)
+
+
 class NeotestDebugpyPlugin:
     """A pytest plugin that would make debugpy stop at thrown exceptions."""
 